@@ -1,8 +1,55 @@
+import gzip
 import os
-import requests
-from datetime import datetime, timezone
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib.parse import parse_qs, quote, urlparse
 import json
 
+# Number of concurrent GitHub API requests in flight
+MAX_WORKERS = 64
+
+# Retry budget for rate-limited (403/429) responses
+MAX_RETRIES = 5
+
+# Seconds to wait for GitHub to connect/respond before giving up on a request
+REQUEST_TIMEOUT = 30
+
+# Number of file histories requested per GraphQL query
+GRAPHQL_BATCH_SIZE = 100
+
+# Optional token; required for GraphQL and raises the REST rate limit
+GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
+
+# On-disk HTTP cache; expired entries are revalidated with If-None-Match /
+# If-Modified-Since, and GitHub's 304 replies don't count against the rate limit
+CACHE_FILE = 'gh_cache.sqlite'
+
+# Crawl state kept between runs; repos are only rescanned when pushed_at changes
+DB_FILE = 'gh_index.db'
+
+# Shared session so every worker thread reuses pooled TCP/TLS connections.
+# pool_block makes threads wait for a pooled connection rather than opening
+# (and then discarding) extra ones, each of which costs a fresh TLS handshake.
+_session = CachedSession(CACHE_FILE, backend='sqlite', cache_control=True, expire_after=3600, stale_if_error=True)
+_session.mount('https://', HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, pool_block=True))
+_session.headers.update({
+    'Accept': 'application/vnd.github+json',
+    'User-Agent': 'sportomax1-master-index'
+})
+if GITHUB_TOKEN:
+    _session.headers['Authorization'] = f"bearer {GITHUB_TOKEN}"
+
+# Shared pool for fan-out of individual requests (pages, directories, per-file
+# lookups) from inside repository scans. Only leaf requests are submitted here,
+# never work that itself waits on this pool, so it cannot deadlock; sharing it
+# keeps the thread count bounded instead of one pool per scanned repository.
+_request_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
 def format_time_since(delta):
     """Converts a timedelta object to a user-friendly 'time since' string."""
     seconds = int(delta.total_seconds())
@@ -19,77 +66,417 @@ def format_time_since(delta):
         days = seconds // 86400
         return f"{days} day{'s' if days > 1 else ''} ago"
 
+def github_request(method, url, json=None):
+    """
+    Send a request to a GitHub API URL through the shared session.
+    Rate-limited responses (403/429) are retried with exponential backoff,
+    waiting until X-RateLimit-Reset when GitHub provides it.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        response = _session.request(method, url, json=json, timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+            return response
+        
+        delay = 2 ** attempt
+        if response.headers.get('Retry-After'):
+            delay = int(response.headers['Retry-After'])
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = int(response.headers.get('X-RateLimit-Reset', 0))
+            delay = max(reset - time.time(), delay)
+        elif response.status_code == 403:
+            # Plain 403 (e.g. a private or blocked resource) is not a rate limit
+            return response
+        
+        print(f"Rate limited on {url}, retrying in {delay:.0f}s...")
+        time.sleep(delay)
+    
+    return response
+
+def github_get(url):
+    """GET a GitHub API URL, retrying rate-limited responses."""
+    return github_request('GET', url)
+
+def write_gzip_copy(path, compresslevel=6):
+    """
+    Writes a gzip-compressed copy of a file next to it (path + '.gz') so it can
+    be served with Content-Encoding: gzip.
+    """
+    with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb', compresslevel=compresslevel) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    
+    return path + '.gz'
+
 def get_github_repos(username):
     """
     Fetch all repositories for a GitHub user.
-    Returns list of repo objects with name, url, description, updated_at, etc.
+    The first page's Link header gives the page count, so the remaining
+    pages are fetched concurrently.
+    Returns list of repo objects with name, url, description, updated_at, etc.,
+    or None if the listing could not be fetched.
     """
-    repos = []
-    page = 1
     per_page = 100
+    base_url = f"https://api.github.com/users/{username}/repos?per_page={per_page}&sort=updated"
     
-    while True:
-        url = f"https://api.github.com/users/{username}/repos?page={page}&per_page={per_page}&sort=updated"
-        response = requests.get(url)
-        
+    response = github_get(f"{base_url}&page=1")
+    if response.status_code != 200:
+        print(f"Error fetching repos: {response.status_code}")
+        return None
+    
+    repos = response.json()
+    
+    last_url = response.links.get('last', {}).get('url')
+    last_page = int(parse_qs(urlparse(last_url).query)['page'][0]) if last_url else 1
+    pages = range(2, last_page + 1)
+    
+    for response in _request_executor.map(lambda page: github_get(f"{base_url}&page={page}"), pages):
+        # A partial list would make missing repos look deleted
         if response.status_code != 200:
             print(f"Error fetching repos: {response.status_code}")
-            break
+            return None
         
-        data = response.json()
-        if not data:
-            break
-        
-        repos.extend(data)
-        page += 1
+        repos.extend(response.json())
     
     return repos
 
-def get_repo_files(username, repo_name, path=''):
+def get_repo_dir(username, repo_name, path):
     """
-    Recursively fetch all files from a GitHub repository.
-    Returns list of file objects with name, path, html_url, type, etc.
+    Fetch the entries of a single directory via the contents API.
+    Returns list of item objects, or None on error.
     """
-    files = []
     url = f"https://api.github.com/repos/{username}/{repo_name}/contents/{path}"
     
     try:
-        response = requests.get(url)
+        response = github_get(url)
         
-        if response.status_code != 200:
-            return files
-        
-        items = response.json()
+        if response.status_code == 200:
+            return response.json()
         
-        for item in items:
-            if item['type'] == 'file':
-                files.append(item)
-            elif item['type'] == 'dir':
-                # Recursively get files from subdirectories
-                files.extend(get_repo_files(username, repo_name, item['path']))
+        print(f"Error fetching files from {repo_name}/{path}: {response.status_code}")
     except Exception as e:
         print(f"Error fetching files from {repo_name}/{path}: {e}")
     
+    return None
+
+def get_repo_contents(username, repo_name):
+    """
+    Fetch all files from a GitHub repository via the contents API.
+    Used when the git tree listing is too large for GitHub to return in one response.
+    Directories are walked breadth-first, listing each level's directories concurrently.
+    Returns list of file objects with name, path, html_url, type, etc., or None
+    if any directory could not be listed.
+    """
+    files = []
+    pending = ['']
+    
+    while pending:
+        batch, pending = pending, []
+        
+        for items in _request_executor.map(lambda path: get_repo_dir(username, repo_name, path), batch):
+            # A partial walk would make the missing files look deleted
+            if items is None:
+                return None
+            
+            for item in items:
+                if item['type'] == 'file':
+                    files.append(item)
+                elif item['type'] == 'dir':
+                    pending.append(item['path'])
+    
     return files
 
+def get_repo_files(username, repo_name, branch='HEAD'):
+    """
+    Fetch all files on a branch of a GitHub repository with a single recursive git tree request.
+    Returns list of file objects with name, path, html_url and size, an empty
+    list for an empty repository, or None if the listing failed.
+    """
+    url = f"https://api.github.com/repos/{username}/{repo_name}/git/trees/{quote(branch)}?recursive=1"
+    
+    try:
+        response = github_get(url)
+        
+        # Empty repositories have no tree (409)
+        if response.status_code == 409:
+            return []
+        
+        if response.status_code != 200:
+            print(f"Error fetching files from {repo_name}: {response.status_code}")
+            return None
+        
+        data = response.json()
+        if data.get('truncated'):
+            print(f"Tree for {repo_name} is truncated, falling back to contents API...")
+            return get_repo_contents(username, repo_name)
+        
+        return [
+            {
+                'name': entry['path'].rsplit('/', 1)[-1],
+                'path': entry['path'],
+                'html_url': f"https://github.com/{username}/{repo_name}/blob/{quote(branch)}/{quote(entry['path'])}",
+                'size': entry.get('size', 0)
+            }
+            for entry in data['tree']
+            if entry['type'] == 'blob'
+        ]
+    except Exception as e:
+        print(f"Error fetching files from {repo_name}: {e}")
+    
+    return None
+
+def parse_github_date(commit_date):
+    """Converts a GitHub ISO-8601 timestamp to an aware datetime."""
+    # fromisoformat only accepts a trailing 'Z' on Python 3.11+
+    return datetime.fromisoformat(commit_date.replace('Z', '+00:00'))
+
 def get_file_last_commit(username, repo_name, file_path):
     """
     Get the last commit timestamp for a specific file.
+    Returns None if the file has no commits; raises if the lookup fails.
     """
-    url = f"https://api.github.com/repos/{username}/{repo_name}/commits?path={file_path}&page=1&per_page=1"
+    url = f"https://api.github.com/repos/{username}/{repo_name}/commits?path={quote(file_path)}&page=1&per_page=1"
     
-    try:
-        response = requests.get(url)
+    response = github_get(url)
+    response.raise_for_status()
+    
+    commits = response.json()
+    if commits:
+        return parse_github_date(commits[0]['commit']['committer']['date'])
+    
+    return None
+
+def get_commit_files(username, repo_name, sha):
+    """
+    Get the paths changed by a commit, following the Link header through
+    every page of its file list (GitHub returns at most 300 files per page).
+    Returns the list of paths (or None on error) and the number of requests made.
+    """
+    url = f"https://api.github.com/repos/{username}/{repo_name}/commits/{sha}"
+    filenames = []
+    request_count = 0
+    
+    while url:
+        response = github_get(url)
+        request_count += 1
         
-        if response.status_code == 200:
+        if response.status_code != 200:
+            return None, request_count
+        
+        filenames.extend(changed['filename'] for changed in response.json().get('files', []))
+        url = response.links.get('next', {}).get('url')
+    
+    return filenames, request_count
+
+def get_repo_last_commits(username, repo_name, paths):
+    """
+    Get the last commit timestamp for every path in a repository.
+    Walks the commit history newest-first and records the first commit that
+    touches each path, stopping as soon as every path has a timestamp.
+    Once the walk has made as many requests as per-file lookups of the
+    remaining paths would cost, or the history runs out, any paths still
+    without a timestamp are looked up individually.
+    Returns a dict mapping path -> datetime, and whether every lookup
+    succeeded (False means some timestamps may be missing or too old).
+    """
+    last_commits = {}
+    complete = True
+    remaining = set(paths)
+    request_count = 0
+    page = 1
+    
+    try:
+        while remaining and request_count < len(remaining):
+            url = f"https://api.github.com/repos/{username}/{repo_name}/commits?page={page}&per_page=100"
+            response = github_get(url)
+            request_count += 1
+            
+            if response.status_code != 200:
+                break
+            
             commits = response.json()
-            if commits:
-                commit_date = commits[0]['commit']['committer']['date']
-                return datetime.strptime(commit_date, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+            if not commits:
+                break
+            
+            for commit in commits:
+                if request_count >= len(remaining):
+                    break
+                
+                filenames, detail_requests = get_commit_files(username, repo_name, commit['sha'])
+                request_count += detail_requests
+                if filenames is None:
+                    # Files changed here would otherwise pick up an older commit's date
+                    complete = False
+                    continue
+                
+                commit_time = parse_github_date(commit['commit']['committer']['date'])
+                for filename in filenames:
+                    if filename in remaining:
+                        remaining.discard(filename)
+                        last_commits[filename] = commit_time
+                
+                if not remaining:
+                    break
+            
+            page += 1
     except Exception as e:
-        print(f"Error fetching commit for {file_path}: {e}")
+        print(f"Error fetching commits for {repo_name}: {e}")
+        complete = False
     
-    return None
+    def lookup(file_path):
+        try:
+            return get_file_last_commit(username, repo_name, file_path), True
+        except Exception as e:
+            print(f"Error fetching commit for {file_path}: {e}")
+            return None, False
+    
+    # Paths the walk did not reach: finish them with one request each, concurrently
+    if remaining:
+        remaining = list(remaining)
+        for file_path, (commit_time, ok) in zip(remaining, _request_executor.map(lookup, remaining)):
+            complete = complete and ok
+            if commit_time:
+                last_commits[file_path] = commit_time
+    
+    return last_commits, complete
+
+def get_repo_last_commits_graphql(username, repo_name, paths):
+    """
+    Get the last commit timestamp for every path in a repository using the
+    GraphQL API, batching one aliased history(path:) lookup per file into
+    each query. Requires GITHUB_TOKEN.
+    Returns a dict mapping path -> datetime, and whether every batch succeeded.
+    """
+    last_commits = {}
+    complete = True
+    
+    for start in range(0, len(paths), GRAPHQL_BATCH_SIZE):
+        batch = paths[start:start + GRAPHQL_BATCH_SIZE]
+        
+        params = ''.join(f", $p{i}: String!" for i in range(len(batch)))
+        fields = ' '.join(f"f{i}: history(first: 1, path: $p{i}) {{ nodes {{ committedDate }} }}" for i in range(len(batch)))
+        query = f"""query($owner: String!, $name: String!{params}) {{
+            repository(owner: $owner, name: $name) {{
+                object(expression: "HEAD") {{ ... on Commit {{ {fields} }} }}
+            }}
+        }}"""
+        variables = {'owner': username, 'name': repo_name}
+        variables.update({f"p{i}": path for i, path in enumerate(batch)})
+        
+        try:
+            response = github_request('POST', 'https://api.github.com/graphql', json={'query': query, 'variables': variables})
+            
+            # Skip only this batch; later batches may still succeed
+            if response.status_code != 200:
+                print(f"Error fetching commits for {repo_name}: {response.status_code}")
+                complete = False
+                continue
+            
+            data = response.json()
+            if data.get('errors'):
+                print(f"Error fetching commits for {repo_name}: {data['errors'][0].get('message')}")
+                complete = False
+            
+            history = ((data.get('data') or {}).get('repository') or {}).get('object') or {}
+            for i, path in enumerate(batch):
+                nodes = (history.get(f"f{i}") or {}).get('nodes')
+                if nodes:
+                    last_commits[path] = parse_github_date(nodes[0]['committedDate'])
+        except Exception as e:
+            print(f"Error fetching commits for {repo_name}: {e}")
+            complete = False
+    
+    return last_commits, complete
+
+def scan_repository(username, repo_name, branch='HEAD'):
+    """
+    Collects every file on a repository's branch together with its last commit time.
+    Returns the file records (None if the files could not be listed) and
+    whether every commit lookup succeeded.
+    """
+    print(f"Scanning repository: {repo_name}...")
+    
+    files = get_repo_files(username, repo_name, branch)
+    if files is None:
+        return None, False
+    
+    paths = [file['path'] for file in files]
+    
+    if GITHUB_TOKEN:
+        last_commits, complete = get_repo_last_commits_graphql(username, repo_name, paths)
+    else:
+        last_commits, complete = get_repo_last_commits(username, repo_name, paths)
+    
+    # A path with no known commit falls back to the scan time below; don't let
+    # that placeholder be saved as final
+    if len(last_commits) < len(paths):
+        complete = False
+    
+    now = datetime.now(timezone.utc)
+    splitext = os.path.splitext
+    file_infos = []
+    
+    for file in files:
+        commit_time = last_commits.get(file['path']) or now
+        size = file.get('size', 0)
+        
+        # Precompute everything the HTML rows need so emission is a plain substitution
+        file_infos.append({
+            'repo': repo_name,
+            'name': file['name'],
+            'path': file['path'],
+            'url': file['html_url'],
+            'size': size,
+            'ts': commit_time.timestamp(),
+            'ext': splitext(file['name'])[1].lower()
+        })
+    
+    return file_infos, complete
+
+def open_index_db(db_file=DB_FILE):
+    """
+    Opens (creating if needed) the SQLite database holding the crawl state.
+    """
+    conn = sqlite3.connect(db_file)
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS repos (
+            name TEXT PRIMARY KEY,
+            pushed_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            repo TEXT,
+            path TEXT,
+            name TEXT,
+            url TEXT,
+            size INTEGER,
+            ts REAL,
+            ext TEXT,
+            PRIMARY KEY (repo, path)
+        );
+    """)
+    return conn
+
+def save_repo_files(conn, repo, file_infos, complete=True):
+    """
+    Replaces the stored files of a repository with a fresh scan.
+    The repo's pushed_at is only recorded when files were found and every
+    commit lookup succeeded, so empty or partially failed scans are retried
+    on the next run. A failed listing (None) keeps the stored files as they are.
+    """
+    if file_infos is None:
+        return
+    
+    conn.execute('DELETE FROM files WHERE repo = ?', (repo['name'],))
+    conn.executemany(
+        'INSERT OR REPLACE INTO files (repo, path, name, url, size, ts, ext) '
+        'VALUES (:repo, :path, :name, :url, :size, :ts, :ext)',
+        file_infos
+    )
+    
+    if file_infos and complete:
+        conn.execute('INSERT OR REPLACE INTO repos (name, pushed_at) VALUES (?, ?)', (repo['name'], repo.get('pushed_at')))
+    else:
+        conn.execute('DELETE FROM repos WHERE name = ?', (repo['name'],))
 
 def generate_master_html_index(username='sportomax1', output_file='master_index.html'):
     """
@@ -98,41 +485,51 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
     
     print(f"Fetching repositories for {username}...")
     repos = get_github_repos(username)
+    
+    # Without a complete repo list, pruning would wipe the stored crawl state;
+    # keep the previous index instead
+    if repos is None:
+        print(f"❌ Could not list repositories for {username}; keeping existing {output_file}")
+        return
+    
     print(f"Found {len(repos)} repositories")
     
-    all_files = []
+    conn = open_index_db()
     
-    # Collect files from all repos
-    for repo in repos:
-        repo_name = repo['name']
-        print(f"Scanning repository: {repo_name}...")
-        
-        files = get_repo_files(username, repo_name)
-        
-        for file in files:
-            # Get last commit time for this file
-            commit_time = get_file_last_commit(username, repo_name, file['path'])
-            
-            file_info = {
-                'repo': repo_name,
-                'name': file['name'],
-                'path': file['path'],
-                'url': file['html_url'],
-                'size': file.get('size', 0),
-                'updated_at': commit_time or datetime.now(timezone.utc)
-            }
-            
-            all_files.append(file_info)
+    # Only rescan repos that have been pushed to since the last run
+    stored = {row['name']: row['pushed_at'] for row in conn.execute('SELECT name, pushed_at FROM repos')}
+    changed = [repo for repo in repos if stored.get(repo['name']) != repo.get('pushed_at')]
+    print(f"{len(changed)} repositories changed since last run")
+    
+    # Collect files from changed repos; each repository is scanned independently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(scan_repository, username, repo['name'], repo.get('default_branch') or 'HEAD'): repo for repo in changed}
+        
+        for future in as_completed(futures):
+            file_infos, complete = future.result()
+            save_repo_files(conn, futures[future], file_infos, complete)
+            # Commit per repo so an interrupted run keeps everything scanned so far
+            conn.commit()
+    
+    # Forget repos that no longer exist
+    repo_names = {repo['name'] for repo in repos}
+    for (name,) in conn.execute('SELECT DISTINCT repo FROM files').fetchall():
+        if name not in repo_names:
+            conn.execute('DELETE FROM files WHERE repo = ?', (name,))
+            conn.execute('DELETE FROM repos WHERE name = ?', (name,))
+    conn.commit()
     
     # Sort by last updated (most recent first)
-    all_files.sort(key=lambda x: x['updated_at'], reverse=True)
+    all_files = conn.execute('SELECT repo, name, path, url, size, ts, ext FROM files ORDER BY ts DESC').fetchall()
+    conn.close()
     
     print(f"Total files found: {len(all_files)}")
     
-    # Generate HTML
-    now = datetime.now(timezone.utc)
+    # Generate HTML, streaming each chunk straight to the output file
+    now_ts = time.time()
     
-    html_content = f"""<!DOCTYPE html>
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -217,13 +614,20 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
         .file-list {{
             list-style: none;
             padding: 0;
+            margin: 0;
+            position: relative;
         }}
         
         .file-item {{
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: 94px;
+            box-sizing: border-box;
+            overflow: hidden;
             padding: 15px;
             border: 1px solid #e0e0e0;
             border-radius: 8px;
-            margin-bottom: 10px;
             background-color: #fff;
             transition: box-shadow 0.2s;
         }}
@@ -244,6 +648,10 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
             font-size: 16px;
             color: #0366d6;
             text-decoration: none;
+            min-width: 0;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
         }}
         
         .file-name:hover {{
@@ -257,6 +665,8 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
             font-size: 11px;
             font-weight: 600;
             color: #586069;
+            flex-shrink: 0;
+            white-space: nowrap;
         }}
         
         .file-meta {{
@@ -270,6 +680,9 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
             color: #999;
             font-size: 12px;
             font-family: monospace;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
         }}
         
         .time-ago {{
@@ -331,7 +744,7 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
             id="searchInput" 
             class="search-input" 
             placeholder="🔍 Search files by name, path, or repository..." 
-            onkeyup="filterFiles()"
+            oninput="filterFiles()"
         >
         
         <div class="filter-controls" id="filterButtons">
@@ -347,36 +760,107 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
         </div>
         
         <ul class="file-list" id="fileList">
-"""
+""")
     
-    # Add file items
-    for file in all_files:
-        time_since = format_time_since(now - file['updated_at'])
-        file_ext = os.path.splitext(file['name'])[1].lower()
-        size_kb = file['size'] / 1024 if file['size'] > 0 else 0
-        size_str = f"{size_kb:.1f} KB" if size_kb > 0 else "0 KB"
-        
-        html_content += f"""
-            <li class="file-item" data-ext="{file_ext}" data-repo="{file['repo']}" data-name="{file['name'].lower()}" data-path="{file['path'].lower()}" data-updated="{file['updated_at'].timestamp()}" data-size="{file['size']}">
-                <div class="file-header">
-                    <a href="{file['url']}" class="file-name" target="_blank">{file['name']}</a>
-                    <span class="repo-badge">{file['repo']}</span>
-                </div>
-                <div class="file-path">{file['path']}</div>
-                <div class="file-meta">
-                    <span class="time-ago">⏱️ {time_since}</span>
-                    <span class="file-size">📦 {size_str}</span>
-                </div>
-            </li>
-"""
-    
-    html_content += """
+        # Embed the file records as compact JSON; the page renders only the rows in view
+        f.write("""
         </ul>
     </div>
     
+    <script id="data" type="application/json">[""")
+        
+        # Hot-loop names bound as locals; one encoder instead of one per json.dumps call
+        write = f.write
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        fmt_time_since = format_time_since
+        
+        for i, file in enumerate(all_files):
+            ts = file['ts']
+            seconds = int(now_ts - ts)
+            
+            # Most files are days old; format those inline instead of via a timedelta
+            if seconds >= 86400:
+                days = seconds // 86400
+                ago = f"{days} day{'s' if days > 1 else ''} ago"
+            else:
+                ago = fmt_time_since(timedelta(seconds=seconds))
+            
+            # Short keys: repo, name, path, url, size, time, ext, ago
+            record = {
+                'r': file['repo'],
+                'n': file['name'],
+                'p': file['path'],
+                'u': file['url'],
+                's': file['size'],
+                't': int(ts),
+                'e': file['ext'],
+                'a': ago
+            }
+            # Escape '<' so file names can never close the script element
+            write((',' if i else '') + encode(record).replace('<', '\\u003c'))
+        
+        f.write("""]</script>
+    
     <script>
+        const FILES = JSON.parse(document.getElementById('data').textContent);
+        const ROW_HEIGHT = 104;
+        const OVERSCAN = 5;
+        
         let currentFilter = 'all';
         let currentSort = 'updated';
+        let view = FILES;
+        let renderedRange = '';
+        
+        const list = document.getElementById('fileList');
+        
+        // Precompute derived strings once instead of on every keystroke or render
+        FILES.forEach(file => {
+            file.nameLower = file.n.toLowerCase();
+            file.search = (file.n + '\\n' + file.p + '\\n' + file.r).toLowerCase();
+            file.sizeStr = file.s > 0 ? (file.s / 1024).toFixed(1) + ' KB' : '0 KB';
+        });
+        
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, ch => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' })[ch]);
+        }
+        
+        function rowBody(file) {
+            // Escape and assemble a record's markup once; scrolling back reuses it
+            if (file.html === undefined) {
+                file.html = `
+                <div class="file-header">
+                    <a href="${escapeHtml(file.u)}" class="file-name" target="_blank">${escapeHtml(file.n)}</a>
+                    <span class="repo-badge">${escapeHtml(file.r)}</span>
+                </div>
+                <div class="file-path">${escapeHtml(file.p)}</div>
+                <div class="file-meta">
+                    <span class="time-ago">⏱️ ${escapeHtml(file.a)}</span>
+                    <span class="file-size">📦 ${file.sizeStr}</span>
+                </div>`;
+            }
+            return file.html;
+        }
+        
+        function renderRow(file, index) {
+            return `<li class="file-item" style="top: ${index * ROW_HEIGHT}px">${rowBody(file)}</li>`;
+        }
+        
+        function renderVisible(force) {
+            // Only rows intersecting the viewport (plus overscan) exist in the DOM
+            const scrolled = -list.getBoundingClientRect().top;
+            const start = Math.max(0, Math.floor(scrolled / ROW_HEIGHT) - OVERSCAN);
+            const end = Math.min(view.length, start + Math.ceil(window.innerHeight / ROW_HEIGHT) + OVERSCAN * 2);
+            const range = start + ':' + end;
+            
+            if (!force && range === renderedRange) return;
+            renderedRange = range;
+            
+            const rows = [];
+            for (let i = start; i < end; i++) {
+                rows.push(renderRow(view[i], i));
+            }
+            list.innerHTML = rows.join('');
+        }
         
         function setFilter(ext) {
             currentFilter = ext;
@@ -392,27 +876,14 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
         
         function filterFiles() {
             const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const items = document.querySelectorAll('.file-item');
-            let visibleCount = 0;
             
-            items.forEach(item => {
-                const ext = item.dataset.ext;
-                const repo = item.dataset.repo.toLowerCase();
-                const name = item.dataset.name;
-                const path = item.dataset.path;
-                
-                const matchesFilter = currentFilter === 'all' || ext === currentFilter;
-                const matchesSearch = name.includes(searchTerm) || path.includes(searchTerm) || repo.includes(searchTerm);
-                
-                if (matchesFilter && matchesSearch) {
-                    item.style.display = 'block';
-                    visibleCount++;
-                } else {
-                    item.style.display = 'none';
-                }
-            });
+            view = FILES.filter(file =>
+                (currentFilter === 'all' || file.e === currentFilter) && file.search.includes(searchTerm)
+            );
             
-            document.getElementById('visibleCount').textContent = visibleCount;
+            list.style.height = (view.length * ROW_HEIGHT) + 'px';
+            document.getElementById('visibleCount').textContent = view.length;
+            renderVisible(true);
         }
         
         function sortFiles(sortBy) {
@@ -424,29 +895,36 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
             });
             event.target.classList.add('active');
             
-            const list = document.getElementById('fileList');
-            const items = Array.from(list.querySelectorAll('.file-item'));
-            
-            items.sort((a, b) => {
+            FILES.sort((a, b) => {
                 if (sortBy === 'updated') {
-                    return parseFloat(b.dataset.updated) - parseFloat(a.dataset.updated);
+                    return b.t - a.t;
                 } else if (sortBy === 'name') {
-                    return a.dataset.name.localeCompare(b.dataset.name);
+                    return a.nameLower.localeCompare(b.nameLower);
                 } else if (sortBy === 'repo') {
-                    return a.dataset.repo.localeCompare(b.dataset.repo);
+                    return a.r.localeCompare(b.r);
                 } else if (sortBy === 'size') {
-                    return parseInt(b.dataset.size) - parseInt(a.dataset.size);
+                    return b.s - a.s;
                 }
             });
             
-            items.forEach(item => list.appendChild(item));
+            filterFiles();
         }
         
+        let renderScheduled = false;
+        window.addEventListener('scroll', () => {
+            if (renderScheduled) return;
+            renderScheduled = true;
+            requestAnimationFrame(() => {
+                renderScheduled = false;
+                renderVisible(false);
+            });
+        });
+        window.addEventListener('resize', () => renderVisible(false));
+        
         // Build filter buttons dynamically
         const extensions = new Set();
-        document.querySelectorAll('.file-item').forEach(item => {
-            const ext = item.dataset.ext;
-            if (ext) extensions.add(ext);
+        FILES.forEach(file => {
+            if (file.e) extensions.add(file.e);
         });
         
         const filterContainer = document.getElementById('filterButtons');
@@ -458,16 +936,16 @@ def generate_master_html_index(username='sportomax1', output_file='master_index.
             btn.onclick = () => setFilter(ext);
             filterContainer.appendChild(btn);
         });
+        
+        filterFiles();
     </script>
 </body>
 </html>
-"""
+""")
     
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    gzip_file = write_gzip_copy(output_file)
     
-    print(f"✅ Master index generated: {output_file}")
+    print(f"✅ Master index generated: {output_file} (+ {gzip_file})")
     print(f"   - {len(repos)} repositories scanned")
     print(f"   - {len(all_files)} total files indexed")
 